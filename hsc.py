@@ -4,81 +4,270 @@ SEO Domain Checker - Tools untuk pengecekan domain SEO marketing
 Penggunaan: python seo_checker.py <file_input.txt>
 """
 
+import asyncio
+import re
+import socket
+import ssl
 import sys
-import requests
+import aiodns
+import aiohttp
+from dataclasses import dataclass
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple
-import time
+from typing import Final, Optional
+
+# Header statis untuk semua request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Maksimal request bersamaan ke satu host (politeness per host,
+# terpisah dari batas concurrency global connector)
+MAX_PER_HOST = 4
+
+# Mode probe: 'http' = request HEAD/GET penuh, 'tcp' = cukup TCP
+# connect + TLS handshake (satu RTT, tanpa request HTTP) via flag --tcp
+PROBE_MODE = 'http'
+
+# SSL context bersama untuk probe TCP
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Status 5xx transien yang layak dicoba ulang satu kali
+RETRYABLE_STATUSES = (502, 503, 504)
+
+# Jeda sebelum retry transien (detik)
+RETRY_BACKOFF = 0.1
+
+# Baris link di file input: "> link" atau "> ```link```"
+LINK_RE = re.compile(r'^>\s*(?:```)?\s*(.*?)\s*(?:```)?\s*$')
 
 # Konfigurasi warna untuk output terminal
 class Colors:
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+    BLUE: Final = '\033[94m'
+    GREEN: Final = '\033[92m'
+    RED: Final = '\033[91m'
+    YELLOW: Final = '\033[93m'
+    RESET: Final = '\033[0m'
+    BOLD: Final = '\033[1m'
+
+# Separator yang dipakai berulang di output, dirakit sekali saja
+BOLD_SEP = f"{Colors.BOLD}{'='*70}{Colors.RESET}\n"
+
+# Tabel lookup status untuk tampilan detail, diindeks langsung dengan
+# byte status (0=error, 1=aktif)
+STATUS_SYMBOL = (f"{Colors.RED}✗{Colors.RESET}", f"{Colors.GREEN}✓{Colors.RESET}")
+STATUS_TEXT = (f"{Colors.RED}ERROR{Colors.RESET}", f"{Colors.GREEN}ACTIVE{Colors.RESET}")
+
+@dataclass(slots=True)
+class PlatformResult:
+    """
+    Hasil pengecekan satu platform; kolom urls + statuses sejalan
+    dengan layout SoA (1 byte status per link)
+    """
+    platform: str
+    total: int
+    active: int
+    error: int
+    urls: list[str]
+    statuses: bytearray
 
-def check_url(url: str, timeout: int = 10) -> Tuple[str, bool]:
+class CachedResolver(aiohttp.abc.AbstractResolver):
     """
-    Memeriksa apakah URL aktif atau tidak
+    Resolver aiohttp yang menyajikan hasil pre-resolve dari cache;
+    hostname yang tidak ada di cache (termasuk yang gagal di-resolve
+    di awal, supaya tidak ada negative caching) jatuh ke resolver biasa
+    """
+
+    def __init__(self, cache: dict[str, list[tuple[int, str]]]):
+        self._cache = cache
+        self._fallback = aiohttp.ThreadedResolver()
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        entries = self._cache.get(host)
+        if not entries:
+            return await self._fallback.resolve(host, port, family)
+
+        # Saring sesuai family yang diminta connector; AF_UNSPEC berarti
+        # v4 dan v6 dua-duanya boleh (untuk racing happy-eyeballs)
+        matches = [
+            {
+                'hostname': host,
+                'host': address,
+                'port': port,
+                'family': addr_family,
+                'proto': 0,
+                'flags': socket.AI_NUMERICHOST,
+            }
+            for addr_family, address in entries
+            if family in (socket.AF_UNSPEC, addr_family)
+        ]
+
+        if not matches:
+            return await self._fallback.resolve(host, port, family)
+
+        return matches
+
+    async def close(self) -> None:
+        await self._fallback.close()
+
+async def prefetch_dns(urls: list[str]) -> dict[str, list[tuple[int, str]]]:
+    """
+    Pre-resolve semua hostname unik sekaligus dengan aiodns sebelum
+    request HTTP dimulai, supaya tiap request tidak membayar RTT DNS.
+    Resolve AF_UNSPEC supaya alamat v4 dan v6 dua-duanya masuk cache
+    dan racing happy-eyeballs tetap jalan untuk host yang di-cache
+    Returns: {hostname: [(family, alamat), ...]} untuk yang berhasil saja
+    """
+    hosts = sorted({host for host in (urlparse(url).hostname for url in urls) if host})
+
+    resolver = aiodns.DNSResolver()
+    answers = await asyncio.gather(
+        *[resolver.getaddrinfo(host, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM)
+          for host in hosts],
+        return_exceptions=True,
+    )
+
+    cache: dict[str, list[tuple[int, str]]] = {}
+    for host, answer in zip(hosts, answers):
+        if isinstance(answer, BaseException):
+            continue
+
+        addresses = []
+        for node in answer.nodes:
+            # pycares mengembalikan alamat sebagai bytes
+            address = node.addr[0]
+            if isinstance(address, bytes):
+                address = address.decode()
+            addresses.append((node.family, address))
+
+        if addresses:
+            cache[host] = addresses
+
+    return cache
+
+def normalize_url(url: str) -> str:
+    """
+    Menormalisasi URL supaya kunci dedup/cache konsisten
+    (example.com dan https://example.com dihitung sebagai satu URL)
+    Mengembalikan '' untuk entri kosong atau 'unavailable'
+    """
+    url = url.strip()
+
+    if not url or url.lower() == 'unavailable':
+        return ''
+
+    # Tambahkan https:// jika tidak ada protocol
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    return url
+
+async def probe_tcp(url: str, timeout: int = 10) -> tuple[str, bool]:
+    """
+    Memeriksa liveness di level TCP/TLS saja: connect (plus handshake
+    untuk https) tanpa mengirim request HTTP
     Returns: (url, is_active)
     """
-    if url.strip().lower() == 'unavailable' or not url.strip():
+    parsed = urlparse(url)
+    host = parsed.hostname
+    if not host:
         return (url, False)
-    
+
+    use_tls = parsed.scheme == 'https'
+    port = parsed.port or (443 if use_tls else 80)
+
     try:
-        # Tambahkan https:// jika tidak ada protocol
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.head(url, timeout=timeout, allow_redirects=True, headers=headers)
-        
-        # Jika HEAD tidak berhasil, coba GET
-        if response.status_code >= 400:
-            response = requests.get(url, timeout=timeout, allow_redirects=True, headers=headers)
-        
-        return (url, response.status_code < 400)
-    
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=_SSL_CONTEXT if use_tls else None),
+            timeout,
+        )
+        writer.close()
+        return (url, True)
+    except Exception:
+        return (url, False)
+
+async def check_url(session: aiohttp.ClientSession,
+                    host_sems: dict[str, asyncio.Semaphore],
+                    url: str, timeout: int = 10) -> tuple[str, bool]:
+    """
+    Memeriksa apakah URL (sudah dinormalisasi di parser) aktif atau tidak
+    Returns: (url, is_active)
+    """
+    try:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # Batasi 4 request bersamaan per host supaya host yang sama
+        # tidak digempur, tanpa menahan host-host lain
+        host = urlparse(url).netloc
+        sem = host_sems.setdefault(host, asyncio.Semaphore(MAX_PER_HOST))
+
+        async with sem:
+            if PROBE_MODE == 'tcp':
+                return await probe_tcp(url, timeout)
+
+            try:
+                response = await session.head(url, timeout=client_timeout, allow_redirects=True)
+            except aiohttp.ClientConnectionError:
+                # Satu kali retry untuk kegagalan koneksi transien
+                await asyncio.sleep(RETRY_BACKOFF)
+                response = await session.head(url, timeout=client_timeout, allow_redirects=True)
+
+            # Coba ulang sekali untuk 5xx transien; release dulu supaya
+            # koneksinya kembali ke pool dan retry memakai koneksi hangat
+            if response.status in RETRYABLE_STATUSES:
+                response.release()
+                await asyncio.sleep(RETRY_BACKOFF)
+                response = await session.head(url, timeout=client_timeout, allow_redirects=True)
+
+            # Coba GET hanya jika server tidak mendukung HEAD (405/501);
+            # status error lain sudah jawaban final, tidak perlu request kedua
+            if response.status in (405, 501):
+                response.release()
+                response = await session.get(url, timeout=client_timeout, allow_redirects=True)
+                response.close()
+
+        # 403 tetap dihitung aktif: domain resolve dan merespons,
+        # itu yang penting untuk cek link SEO
+        return (url, response.status < 400 or response.status == 403)
+
     except Exception as e:
         return (url, False)
 
-def parse_input_file(filename: str) -> Dict[str, List[str]]:
+def parse_input_file(filename: str) -> dict[str, list[str]]:
     """
     Membaca file input dan mengelompokkan link berdasarkan platform
     """
     platforms = {}
-    current_platform = None
-    
+    # Referensi lokal ke list platform aktif; menghindari lookup dict
+    # platforms[nama] untuk setiap baris link
+    current_links: Optional[list[str]] = None
+
     try:
         with open(filename, 'r', encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
-                
+
                 # Skip empty lines
                 if not line:
                     continue
-                
-                # Deteksi platform baru (format: "Platform : count")
-                if ':' in line and not line.startswith('>'):
-                    platform_name = line.split(':')[0].strip()
-                    current_platform = platform_name
-                    platforms[current_platform] = []
-                
+
                 # Deteksi link (format: "> link" atau "> ```link```")
-                elif line.startswith('>') and current_platform:
-                    # Hapus '>' dan backticks
-                    link = line[1:].strip().replace('```', '').strip()
-                    if link:
-                        platforms[current_platform].append(link)
-        
+                if line.startswith('>'):
+                    if current_links is not None:
+                        match = LINK_RE.match(line)
+                        # Normalisasi sekali di sini; entri kosong atau
+                        # 'unavailable' langsung dibuang
+                        link = normalize_url(match.group(1)) if match else ''
+                        if link:
+                            current_links.append(link)
+
+                # Deteksi platform baru (format: "Platform : count");
+                # partition menghindari alokasi list dari split
+                elif ':' in line:
+                    current_links = []
+                    platforms[line.partition(':')[0].strip()] = current_links
+
         return platforms
-    
+
     except FileNotFoundError:
         print(f"{Colors.RED}Error: File '{filename}' tidak ditemukan!{Colors.RESET}")
         sys.exit(1)
@@ -86,110 +275,137 @@ def parse_input_file(filename: str) -> Dict[str, List[str]]:
         print(f"{Colors.RED}Error membaca file: {str(e)}{Colors.RESET}")
         sys.exit(1)
 
-def check_platform_links(platform: str, links: List[str]) -> Dict:
-    """
-    Memeriksa semua link untuk satu platform secara paralel
-    """
-    results = {
-        'platform': platform,
-        'total': len(links),
-        'active': 0,
-        'error': 0,
-        'links': []
-    }
-    
-    print(f"  Checking {platform}... ", end='', flush=True)
-    
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_url = {executor.submit(check_url, link): link for link in links}
-        
-        for future in as_completed(future_to_url):
-            url, is_active = future.result()
-            
-            if is_active:
-                results['active'] += 1
-                status = 'active'
-            else:
-                results['error'] += 1
-                status = 'error'
-            
-            results['links'].append({
-                'url': url,
-                'status': status
-            })
-    
-    print(f"{Colors.GREEN}✓{Colors.RESET}")
-    return results
-
-def display_results(all_results: List[Dict]):
+async def check_all_links(platforms_data: dict[str, list[str]]) -> list[PlatformResult]:
+    """
+    Memeriksa semua link dari semua platform sekaligus dalam satu
+    event loop, lalu mengelompokkan hasilnya kembali per platform
+    """
+    # Cek setiap URL unik satu kali saja; link yang sama di banyak
+    # platform cukup satu request
+    unique_urls = sorted({url
+                          for links in platforms_data.values()
+                          for url in links})
+
+    # Resolve semua hostname sekali di depan; selama pengecekan
+    # berjalan resolver tinggal membaca cache
+    dns_cache = await prefetch_dns(unique_urls)
+
+    # happy_eyeballs: coba alamat v4/v6 secara paralel (jeda 250ms)
+    # supaya host dengan AAAA record lambat tidak memakan timeout penuh
+    connector = aiohttp.TCPConnector(
+        limit=200,
+        keepalive_timeout=30,
+        happy_eyeballs_delay=0.25,
+        interleave=1,
+        family=socket.AF_UNSPEC,
+        ttl_dns_cache=900,
+        use_dns_cache=True,
+        resolver=CachedResolver(dns_cache),
+    )
+
+    # Semaphore per netloc; dibuat lazy di check_url saat host
+    # pertama kali dijumpai
+    host_sems: dict[str, asyncio.Semaphore] = {}
+
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        checked = await asyncio.gather(
+            *[check_url(session, host_sems, url) for url in unique_urls]
+        )
+
+    status_by_url = {url: is_active for url, is_active in checked}
+
+    # Susun hasil per platform dari cache, urutan link asli dipertahankan.
+    # Layout kolom (urls + statuses) lebih hemat daripada list of dict:
+    # satu byte per link, 1=aktif 0=error
+    all_results = []
+    for platform, links in platforms_data.items():
+        statuses = bytearray(status_by_url[url] for url in links)
+
+        all_results.append(PlatformResult(
+            platform=platform,
+            total=len(links),
+            active=statuses.count(1),
+            error=statuses.count(0),
+            urls=list(links),
+            statuses=statuses,
+        ))
+
+    return all_results
+
+def display_results(all_results: list[PlatformResult]):
     """
     Menampilkan hasil pengecekan dengan format yang diminta
+    Semua baris dirakit di satu buffer lalu ditulis sekali
     """
-    print(f"\n{Colors.BOLD}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}HASIL PENGECEKAN DOMAIN SEO{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}\n")
-    
+    parts = [f"\n{BOLD_SEP}",
+             f"{Colors.BOLD}HASIL PENGECEKAN DOMAIN SEO{Colors.RESET}\n",
+             f"{BOLD_SEP}\n"]
+
     total_all = 0
     total_active = 0
     total_error = 0
-    
+
     for result in all_results:
-        platform = result['platform']
-        total = result['total']
-        active = result['active']
-        error = result['error']
-        
+        platform = result.platform
+        total = result.total
+        active = result.active
+        error = result.error
+
         total_all += total
         total_active += active
         total_error += error
-        
+
         # Format output: Platform [Total] [Active] [Error]
-        status_color = Colors.GREEN if error == 0 else Colors.YELLOW if active > 0 else Colors.RED
-        
-        print(f"{Colors.BLUE}{Colors.BOLD}{platform:<20}{Colors.RESET} ", end='')
-        print(f"[{total}] ", end='')
-        print(f"{Colors.GREEN}[{active}]{Colors.RESET} ", end='')
-        
+        parts.append(f"{Colors.BLUE}{Colors.BOLD}{platform:<20}{Colors.RESET} ")
+        parts.append(f"[{total}] ")
+        parts.append(f"{Colors.GREEN}[{active}]{Colors.RESET} ")
+
         if error > 0:
-            print(f"{Colors.RED}[{error}]{Colors.RESET}")
+            parts.append(f"{Colors.RED}[{error}]{Colors.RESET}\n")
         else:
-            print()
-    
+            parts.append("\n")
+
     # Summary
-    print(f"\n{Colors.BOLD}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}SUMMARY{Colors.RESET}")
-    print(f"Total Links     : {total_all}")
-    print(f"Active Links    : {Colors.GREEN}{total_active}{Colors.RESET}")
-    print(f"Error Links     : {Colors.RED}{total_error}{Colors.RESET}")
-    print(f"Success Rate    : {(total_active/total_all*100):.1f}%" if total_all > 0 else "0%")
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}\n")
+    parts.append(f"\n{BOLD_SEP}")
+    parts.append(f"{Colors.BOLD}SUMMARY{Colors.RESET}\n")
+    parts.append(f"Total Links     : {total_all}\n")
+    parts.append(f"Active Links    : {Colors.GREEN}{total_active}{Colors.RESET}\n")
+    parts.append(f"Error Links     : {Colors.RED}{total_error}{Colors.RESET}\n")
+    parts.append(f"Success Rate    : {(total_active/total_all*100):.1f}%\n" if total_all > 0 else "0%\n")
+    parts.append(f"{BOLD_SEP}\n")
 
-def display_detailed_results(all_results: List[Dict]):
+    sys.stdout.write(''.join(parts))
+
+def display_detailed_results(all_results: list[PlatformResult]):
     """
     Menampilkan hasil detail per link
     """
-    print(f"\n{Colors.BOLD}DETAIL PENGECEKAN PER LINK{Colors.RESET}\n")
-    
+    parts = [f"\n{Colors.BOLD}DETAIL PENGECEKAN PER LINK{Colors.RESET}\n\n"]
+
     for result in all_results:
-        print(f"\n{Colors.BLUE}{Colors.BOLD}{result['platform']} ({result['active']}/{result['total']} active){Colors.RESET}")
-        print("-" * 70)
-        
-        for i, link_data in enumerate(result['links'], 1):
-            url = link_data['url']
-            status = link_data['status']
-            
-            status_symbol = f"{Colors.GREEN}✓{Colors.RESET}" if status == 'active' else f"{Colors.RED}✗{Colors.RESET}"
-            status_text = f"{Colors.GREEN}ACTIVE{Colors.RESET}" if status == 'active' else f"{Colors.RED}ERROR{Colors.RESET}"
-            
-            print(f"  {i}. {status_symbol} [{status_text}] {url}")
+        parts.append(f"\n{Colors.BLUE}{Colors.BOLD}{result.platform} ({result.active}/{result.total} active){Colors.RESET}\n")
+        parts.append("-" * 70 + "\n")
+
+        for i, (url, is_active) in enumerate(zip(result.urls, result.statuses), 1):
+            parts.append(f"  {i}. {STATUS_SYMBOL[is_active]} [{STATUS_TEXT[is_active]}] {url}\n")
+
+    sys.stdout.write(''.join(parts))
 
 def main():
     print(f"\n{Colors.BOLD}{Colors.BLUE}SEO DOMAIN CHECKER{Colors.RESET}")
     print(f"{Colors.BOLD}{'='*70}{Colors.RESET}\n")
-    
+
     # Cek argument
-    if len(sys.argv) < 2:
-        print(f"{Colors.YELLOW}Penggunaan: python seo_checker.py <file_input.txt>{Colors.RESET}")
+    global PROBE_MODE
+    args = sys.argv[1:]
+
+    # Flag --tcp: cukup probe TCP/TLS, tanpa request HTTP
+    if '--tcp' in args:
+        PROBE_MODE = 'tcp'
+        args.remove('--tcp')
+
+    if not args:
+        print(f"{Colors.YELLOW}Penggunaan: python seo_checker.py <file_input.txt> [--tcp]{Colors.RESET}")
         print(f"\nContoh file input:")
         print(f"  Youtube : 2")
         print(f"  > https://youtube.com/watch?v=...")
@@ -197,29 +413,25 @@ def main():
         print(f"  Medium : 2")
         print(f"  > unavailable\n")
         sys.exit(1)
-    
-    filename = sys.argv[1]
-    
+
+    filename = args[0]
+
     print(f"📁 Membaca file: {Colors.BOLD}{filename}{Colors.RESET}")
     platforms_data = parse_input_file(filename)
-    
+
     if not platforms_data:
         print(f"{Colors.RED}Tidak ada data platform ditemukan!{Colors.RESET}")
         sys.exit(1)
-    
+
     print(f"✓ Ditemukan {len(platforms_data)} platform\n")
     print(f"{Colors.BOLD}Memulai pengecekan...{Colors.RESET}\n")
-    
-    # Proses setiap platform
-    all_results = []
-    for platform, links in platforms_data.items():
-        result = check_platform_links(platform, links)
-        all_results.append(result)
-        time.sleep(0.5)  # Delay kecil untuk menghindari rate limiting
-    
+
+    # Proses semua platform sekaligus dalam satu event loop
+    all_results = asyncio.run(check_all_links(platforms_data))
+
     # Tampilkan hasil
     display_results(all_results)
-    
+
     # Tanya apakah ingin melihat detail
     try:
         show_detail = input(f"\n{Colors.YELLOW}Tampilkan detail per link? (y/n): {Colors.RESET}").lower()
@@ -228,7 +440,7 @@ def main():
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}Program dihentikan.{Colors.RESET}")
         sys.exit(0)
-    
+
     print(f"\n{Colors.GREEN}✓ Pengecekan selesai!{Colors.RESET}\n")
 
 if __name__ == "__main__":
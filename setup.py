@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Build opsional: kompilasi hsc.py ke C extension dengan mypyc supaya
+parser dan formatter (bagian string-heavy) berjalan sebagai kode
+native, bukan bytecode CPython. Bagian network tetap I/O-bound dan
+tidak terpengaruh.
+
+Penggunaan: pip install mypy && python setup.py build_ext --inplace
+Tanpa build ini, python hsc.py tetap jalan seperti biasa.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='hsc',
+    ext_modules=mypycify(['hsc.py']),
+)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Smoke test pipeline pengecekan: prefetch DNS, resolver cache, dan
+check_url dijalankan utuh terhadap server HTTP lokal
+Penggunaan: python -m unittest test_hsc
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+
+import hsc
+
+class CheckAllLinksSmokeTest(unittest.TestCase):
+
+    def _check_local(self, handler):
+        """
+        Menjalankan check_all_links terhadap satu URL yang dilayani
+        handler di server lokal, mengembalikan PlatformResult-nya
+        """
+        async def run():
+            app = web.Application()
+            app.router.add_route('*', '/', handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+
+            try:
+                results = await hsc.check_all_links(
+                    {'Local': [f'http://127.0.0.1:{port}/']})
+            finally:
+                await runner.cleanup()
+
+            return results[0]
+
+        return asyncio.run(run())
+
+    def test_live_url_reported_active(self):
+        async def ok(request):
+            return web.Response(text='ok')
+
+        result = self._check_local(ok)
+        self.assertEqual(result.active, 1)
+        self.assertEqual(result.error, 0)
+
+    def test_missing_page_reported_error(self):
+        async def not_found(request):
+            return web.Response(status=404)
+
+        result = self._check_local(not_found)
+        self.assertEqual(result.active, 0)
+        self.assertEqual(result.error, 1)
+
+if __name__ == '__main__':
+    unittest.main()